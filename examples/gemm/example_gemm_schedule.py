@@ -1,9 +1,83 @@
+import functools
+
 import tilelang
 import tilelang.language as T
 
+# Default tile shapes per (arch family, dtype). Wider, asymmetric N tiles
+# cut L2 pressure and raise operand reuse across the K sweep on Hopper-class
+# parts (DeepGEMM reports +16% moving FP8 GEMM from 128x128 to 128x160
+# tiles on H800).
+_DEFAULT_BLOCK_SHAPES = {
+    ("hopper", "float16"): (128, 256, 64),
+    ("hopper", "bfloat16"): (128, 256, 64),
+    ("hopper", "e4m3_float8"): (128, 160, 128),
+    ("ampere", "float16"): (128, 128, 32),
+}
+
+# Short aliases for the reduced-precision variants; halving the byte width
+# halves global-memory traffic and doubles tensor-core throughput where the
+# hardware supports it.
+_DTYPE_ALIASES = {
+    "bf16": "bfloat16",
+    "e4m3": "e4m3_float8",
+    "e5m2": "e5m2_float8",
+}
+
+
+def _default_block_shape(dtype):
+    """Return a (block_M, block_N, block_K) default for the current arch."""
+    from tilelang.carver.arch import auto_infer_current_arch, is_hopper_arch
+
+    arch = auto_infer_current_arch()
+    family = "hopper" if is_hopper_arch(arch) else "ampere"
+    return _DEFAULT_BLOCK_SHAPES.get((family, dtype), (128, 128, 32))
+
+
+def _is_hopper():
+    from tilelang.carver.arch import auto_infer_current_arch, is_hopper_arch
+
+    return is_hopper_arch(auto_infer_current_arch())
 
+
+def _select_panel_size(M, N, block_M, block_N):
+    """Pick a swizzle panel size for the launch grid.
+
+    Grids too small to stress the L2 gain nothing from swizzling, so disable
+    it there; otherwise use a narrower panel on Hopper, whose larger L2
+    already covers the A/B tile reuse of neighbouring CTAs.
+    """
+    from tilelang.carver.arch import auto_infer_current_arch, is_hopper_arch
+
+    arch = auto_infer_current_arch()
+    grid_size = ((M + block_M - 1) // block_M) * ((N + block_N - 1) // block_N)
+    if grid_size < 2 * arch.compute_max_core:
+        return 1
+    return 4 if is_hopper_arch(arch) else 8
+
+
+# The jit wrapper already memoizes compiled kernels per call-args; this outer
+# lru_cache only shaves the key construction and dict lookups of those inner
+# cache layers off hot sweep/benchmark loops.
+@functools.lru_cache(maxsize=None)
 @tilelang.jit(out_idx=[-1])
-def matmul(M, N, K, block_M, block_N, block_K, dtype="float16", accum_dtype="float"):
+def matmul(M, N, K, block_M=None, block_N=None, block_K=None, dtype="float16", accum_dtype="float"):
+    dtype = _DTYPE_ALIASES.get(dtype, dtype)
+    if dtype in ("e4m3_float8", "e5m2_float8"):
+        assert accum_dtype == "float", "FP8 GEMM requires float32 accumulation"
+        from tilelang.carver.arch import auto_infer_current_arch, is_ada_arch, is_hopper_arch
+        arch = auto_infer_current_arch()
+        assert is_ada_arch(arch) or is_hopper_arch(arch), (
+            "FP8 GEMM requires sm_89 or later tensor cores")
+    if None in (block_M, block_N, block_K):
+        default_M, default_N, default_K = _default_block_shape(dtype)
+        block_M = block_M or default_M
+        block_N = block_N or default_N
+        block_K = block_K or default_K
+    panel_size = _select_panel_size(M, N, block_M, block_N)
+    # The lowering already picks TMA bulk copies and warpgroup-async (WGMMA)
+    # matmul by default on sm_90 (see tilelang.engine.phase); one extra
+    # pipeline stage keeps the deeper WGMMA pipeline fed.
+    num_stages = 4 if _is_hopper() else 3
 
     @T.prim_func
     def gemm_schedule(
@@ -16,22 +90,37 @@ def matmul(M, N, K, block_M, block_N, block_K, dtype="float16", accum_dtype="flo
             B_shared = T.alloc_shared((block_K, block_N), dtype)
             C_local = T.alloc_fragment((block_M, block_N), accum_dtype)
 
-            # Enable rasterization for better L2 Cache Locality
-            T.use_swizzle(panel_size=10)
+            # Enable rasterization for better L2 Cache Locality; the panel
+            # size is picked per (grid, arch) and swizzle is disabled when
+            # the grid is too small to benefit.
+            T.use_swizzle(panel_size=panel_size, enable=panel_size > 1)
 
             # Clear the local buffer
             T.clear(C_local)
 
             # Auto pipeline the computation
-            for ko in T.Pipelined(T.ceildiv(K, block_K), num_stages=3):
+            for ko in T.Pipelined(T.ceildiv(K, block_K), num_stages=num_stages):
                 T.copy(A[by * block_M, ko * block_K], A_shared)
 
-                # Instead of using
-                # T.copy(B[k * block_K, bx * block_N], B_shared)
-                # we can also use Parallel to auto map the thread
-                # bindings and vectorize the copy operation.
-                for k, j in T.Parallel(block_K, block_N):
-                    B_shared[k, j] = B[ko * block_K + k, bx * block_N + j]
+                # Use T.copy so the lowering emits bulk async transfers
+                # (cp.async on sm_80+) that overlap with compute under the
+                # pipelined loop. An equivalent elementwise variant is
+                #     for k in T.serial(block_K):
+                #         row = ko * block_K + k
+                #         for j in T.Parallel(block_N):
+                #             B_shared[k, j] = B[row, bx * block_N + j]
+                # which auto-maps thread bindings and vectorizes the copy,
+                # but stays on the synchronous load path. Hoisting the row
+                # base out of the parallel loop keeps the shared part of the
+                # address scalar (uniform) in SASS, so each thread only adds
+                # its per-thread column offset. To force 128-bit loads
+                # (8 x fp16 = one LDG.E.128 / uint4) instead of relying on
+                # the auto-vectorizer, split the column axis explicitly:
+                #     for k, j in T.Parallel(block_K, block_N // 8):
+                #         for v in T.vectorized(8):
+                #             B_shared[k, j * 8 + v] = B[ko * block_K + k, bx * block_N + j * 8 + v]
+                # (requires block_N % 8 == 0, which holds for the defaults).
+                T.copy(B[ko * block_K, bx * block_N], B_shared)
 
                 T.gemm(A_shared, B_shared, C_local)
 
@@ -40,13 +129,76 @@ def matmul(M, N, K, block_M, block_N, block_K, dtype="float16", accum_dtype="flo
     return gemm_schedule
 
 
-def main():
-    kernel = matmul(1024, 1024, 1024, 128, 128, 32)
+def _select_split_k(M, N, K, block_M, block_N):
+    """Choose a K-split factor for skinny problems.
+
+    When the output grid alone cannot fill the GPU, partition K across
+    extra CTAs; the factor is capped at 8 and reduced until it divides K.
+    """
+    from tilelang.carver.arch import auto_infer_current_arch
+
+    arch = auto_infer_current_arch()
+    grid_size = ((M + block_M - 1) // block_M) * ((N + block_N - 1) // block_N)
+    split_k = min(max(1, arch.compute_max_core // grid_size), 8)
+    while split_k > 1 and K % split_k != 0:
+        split_k -= 1
+    return split_k
+
+
+# Split-K variant for skinny problems (e.g. M=N=128, K=1024), where one CTA
+# per output tile underfills the GPU. Each of the split_k CTAs along the
+# z-axis reduces one K-slab and accumulates into C with atomic_add, so C is
+# float32 and must be zero-initialized by the caller (hence no out_idx).
+@functools.lru_cache(maxsize=None)
+@tilelang.jit
+def matmul_split_k(M,
+                   N,
+                   K,
+                   block_M,
+                   block_N,
+                   block_K,
+                   split_k=None,
+                   dtype="float16",
+                   accum_dtype="float"):
+    if split_k is None:
+        split_k = _select_split_k(M, N, K, block_M, block_N)
+    assert K % split_k == 0, "split_k must divide K"
+    splitK = K // split_k
+
+    @T.prim_func
+    def gemm_schedule_split_k(
+            A: T.Tensor((M, K), dtype),
+            B: T.Tensor((K, N), dtype),
+            C: T.Tensor((M, N), "float32"),
+    ):
+        with T.Kernel(
+                T.ceildiv(N, block_N), T.ceildiv(M, block_M), split_k, threads=128) as (bx, by, bz):
+            A_shared = T.alloc_shared((block_M, block_K), dtype)
+            B_shared = T.alloc_shared((block_K, block_N), dtype)
+            C_shared = T.alloc_shared((block_M, block_N), "float32")
+            C_local = T.alloc_fragment((block_M, block_N), accum_dtype)
+
+            T.clear(C_local)
+            for ko in T.Pipelined(T.ceildiv(splitK, block_K), num_stages=0):
+                T.copy(A[by * block_M, bz * splitK + ko * block_K], A_shared)
+                T.copy(B[bz * splitK + ko * block_K, bx * block_N], B_shared)
+                T.gemm(A_shared, B_shared, C_local)
+
+            T.copy(C_local, C_shared)
+            for i, j in T.Parallel(block_M, block_N):
+                T.atomic_add(C[by * block_M + i, bx * block_N + j], C_shared[i, j])
+
+    return gemm_schedule_split_k
+
+
+def main(dtype="float16"):
+    kernel = matmul(1024, 1024, 1024, 128, 128, 32, dtype=dtype)
 
     import torch
 
-    a = torch.randn(1024, 1024).cuda().half()
-    b = torch.randn(1024, 1024).cuda().half()
+    torch_dtype = getattr(torch, dtype)
+    a = torch.randn(1024, 1024).cuda().to(torch_dtype)
+    b = torch.randn(1024, 1024).cuda().to(torch_dtype)
 
     c = kernel(a, b)
 
@@ -57,13 +209,31 @@ def main():
     print("ref_c:")
     print(ref_c)
 
-    torch.testing.assert_close(c, ref_c, rtol=1e-2, atol=1e-2)
+    # bf16 keeps fewer mantissa bits than fp16, so allow a looser tolerance.
+    tol = 2e-2 if dtype == "bfloat16" else 1e-2
+    torch.testing.assert_close(c, ref_c, rtol=tol, atol=tol)
     print("All check passed.")
 
     # Get CUDA Source
     print("CUDA Source:")
     print(kernel.get_kernel_source())
 
+    # Split-K path on a skinny problem: the 1x8 output grid underfills the
+    # GPU without partitioning K. C accumulates via atomic_add, so it must
+    # be a zero-initialized float32 tensor.
+    M, N, K = 128, 1024, 4096
+    splitk_kernel = matmul_split_k(M, N, K, 128, 128, 32, dtype=dtype)
+
+    a = torch.randn(M, K).cuda().to(torch_dtype)
+    b = torch.randn(K, N).cuda().to(torch_dtype)
+    c = torch.zeros(M, N).cuda().float()
+
+    splitk_kernel(a, b, c)
+
+    ref_c = (a @ b).to(c.dtype)
+    torch.testing.assert_close(c, ref_c, rtol=tol, atol=tol)
+    print("Split-K check passed.")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,20 @@
+import pytest
+import tilelang.testing
+from tilelang.carver.utils import get_rasterization_code
+
+
+def test_rasterization_code_emits_identity_guard():
+    code = get_rasterization_code(8)
+    assert "const int MAX_BLOCK_N = 8;" in code
+    # Tiny grids must fall through to the identity mapping.
+    assert "const bool useSwizzle" in code
+    assert "gridDim.y > MAX_BLOCK_N" in code
+
+
+def test_rasterization_code_rejects_invalid_panel_width():
+    with pytest.raises(ValueError):
+        get_rasterization_code(0)
+
+
+if __name__ == "__main__":
+    tilelang.testing.main()
@@ -242,49 +242,93 @@ class KernelCache:
             - wrapped_kernel.cu: The wrapped kernel source code
             - kernel_lib.so: The compiled kernel library
             - params.pkl: The serialized kernel parameters
+
+            All files are written to a temporary directory first and only
+            published (with an atomic rename) when every artifact was saved,
+            so concurrent processes never observe a partially written cache
+            entry.
         """
         cache_path = self._get_cache_path(key)
-        os.makedirs(cache_path, exist_ok=True)  # Ensure directory exists
+        temp_path = f"{cache_path}.tmp.{os.getpid()}"
+        os.makedirs(temp_path, exist_ok=True)  # Ensure directory exists
+        save_ok = True
 
         # Save kernel source code
         try:
-            kernel_path = os.path.join(cache_path, KERNEL_PATH)
+            kernel_path = os.path.join(temp_path, KERNEL_PATH)
             if kernel.artifact.kernel_source is not None:
                 with open(kernel_path, "w") as f:
                     f.write(kernel.artifact.kernel_source)
         except Exception as e:
+            save_ok = False
             self.logger.error(f"Error saving kernel source code to disk: {e}")
 
         # Save wrapped kernel source code
         try:
-            wrapped_kernel_path = os.path.join(cache_path, WRAPPED_KERNEL_PATH)
+            wrapped_kernel_path = os.path.join(temp_path, WRAPPED_KERNEL_PATH)
             with open(wrapped_kernel_path, "w") as f:
                 f.write(kernel.adapter.get_kernel_source())
         except Exception as e:
+            save_ok = False
             self.logger.error(f"Error saving wrapped kernel source code to disk: {e}")
 
         # Save kernel library
         try:
             if self.execution_backend == "nvrtc":
-                kernel_lib_path = os.path.join(cache_path, KERNEL_CUBIN_PATH)
+                kernel_lib_path = os.path.join(temp_path, KERNEL_CUBIN_PATH)
             else:
-                kernel_lib_path = os.path.join(cache_path, KERNEL_LIB_PATH)
+                kernel_lib_path = os.path.join(temp_path, KERNEL_LIB_PATH)
             src_lib_path = kernel.adapter.libpath
             shutil.copy(src_lib_path, kernel_lib_path)
             if self.execution_backend == "nvrtc":
                 shutil.copy(
-                    src_lib_path.replace(".cubin", ".py"), os.path.join(cache_path, KERNEL_PY_PATH))
+                    src_lib_path.replace(".cubin", ".py"), os.path.join(temp_path, KERNEL_PY_PATH))
         except Exception as e:
+            save_ok = False
             self.logger.error(f"Error saving kernel library to disk: {e}")
 
         # Save kernel parameters
         try:
-            params_path = os.path.join(cache_path, PARAMS_PATH)
+            params_path = os.path.join(temp_path, PARAMS_PATH)
             with open(params_path, "wb") as f:
                 cloudpickle.dump(kernel.params, f)
         except Exception as e:
+            save_ok = False
             self.logger.error(f"Error saving kernel parameters to disk: {e}")
 
+        if not save_ok:
+            # Never publish an incomplete entry; the next process retries.
+            shutil.rmtree(temp_path, ignore_errors=True)
+            return
+
+        # Atomically publish the entry; if another process won the race its
+        # artifacts are equivalent, so just drop ours. A stale incomplete
+        # directory (e.g. from a crashed save) is removed and replaced.
+        try:
+            os.rename(temp_path, cache_path)
+        except OSError:
+            if not self._is_cache_entry_complete(cache_path):
+                shutil.rmtree(cache_path, ignore_errors=True)
+                try:
+                    os.rename(temp_path, cache_path)
+                    return
+                except OSError:
+                    pass
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+    def _is_cache_entry_complete(self, cache_path: str) -> bool:
+        """
+        Checks whether a published cache entry holds every artifact that
+        _load_kernel_from_disk needs.
+        """
+        if self.execution_backend == "nvrtc":
+            lib_path = KERNEL_CUBIN_PATH
+        else:
+            lib_path = KERNEL_LIB_PATH
+        return all(
+            os.path.exists(os.path.join(cache_path, filename))
+            for filename in (WRAPPED_KERNEL_PATH, lib_path, PARAMS_PATH))
+
     def _load_kernel_from_disk(
         self,
         key: str,
@@ -1,6 +1,9 @@
 """Policy for cuda core schedule"""
 import functools
+import itertools
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from queue import PriorityQueue
 from typing import Iterable, Dict, List, Optional
 
@@ -85,23 +88,56 @@ class DefaultPolicy:
 
         rstep_map = {node: self._assign_reduce_step(node) for node in self.ordered_nodes}
         smem_tile_condidates = self.dfs_smem_tile(base_tile, rstep_map)
+        if topk > 4:
+            return self._emit_config_parallel(smem_tile_condidates, topk)
         results = []
         for td in smem_tile_condidates:
-            if not self.check_tile_shape_isvalid(td):
-                continue
+            results.extend(self._emit_candidate_config(td, topk - len(results)))
+            if len(results) >= topk:
+                break
+        return results
 
-            self._expand_reduce_axis(td)
-            for codegen_dicts in self.assign_block_size(td):
-                if isinstance(codegen_dicts, dict) and len(codegen_dicts) == 1:
-                    results.append(list(codegen_dicts.values())[0])
-                else:
-                    results.append(codegen_dicts)
-                if len(results) >= topk:
-                    break
+    def _emit_candidate_config(self, td: TileDict, topk: int) -> List[Hint]:
+        """
+        Evaluates a single shared-memory tile candidate, yielding at most
+        topk hints. Only mutates the given TileDict, so candidates can be
+        evaluated independently.
+        """
+        if not self.check_tile_shape_isvalid(td):
+            return []
+        self._expand_reduce_axis(td)
+        results = []
+        for codegen_dicts in self.assign_block_size(td):
+            if isinstance(codegen_dicts, dict) and len(codegen_dicts) == 1:
+                results.append(next(iter(codegen_dicts.values())))
+            else:
+                results.append(codegen_dicts)
             if len(results) >= topk:
                 break
         return results
 
+    def _emit_config_parallel(self, smem_tile_condidates: Iterable[TileDict],
+                              topk: int) -> List[Hint]:
+        """
+        Evaluates tile candidates in a thread pool. Candidate evaluations are
+        independent and the heavy work is TVM C++ calls that release the GIL,
+        so threads are preferred over processes. Candidates are consumed in
+        order-preserving chunks until topk hints are collected, keeping the
+        result identical to the sequential path.
+        """
+        results = []
+        candidates = iter(smem_tile_condidates)
+        max_workers = min(topk, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(results) < topk:
+                chunk = list(itertools.islice(candidates, max_workers))
+                if not chunk:
+                    break
+                for hints in executor.map(
+                        functools.partial(self._emit_candidate_config, topk=topk), chunk):
+                    results.extend(hints)
+        return results[:topk]
+
     def dfs_smem_tile(self, init_tile, rstep_map) -> Iterable[TileDict]:
         _steps = [get_all_factors(n) for n in self.output_nodes[0].get_space_dim()]
         steps = [step[step.index(t):] for step, t in zip(_steps, init_tile)]
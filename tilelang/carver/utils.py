@@ -1,3 +1,4 @@
+import functools
 from typing import List, Optional, Union
 from tvm import tir, IRModule
 from tvm.tir import PrimFunc
@@ -11,21 +12,46 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def get_rasterization_code(pannel_width: int = 8) -> str:
+@functools.lru_cache(maxsize=None)
+def _rasterization_code(pannel_width: int) -> str:
+    # Hoist the panel width and panel offset into single expressions so the
+    # emitted CUDA issues one division/modulo chain per block instead of
+    # recomputing `baseBlockIdx - panelIdx * MAX_BLOCK_N * gridDim.x` three
+    # times; dynamic index arithmetic competes with tensor-core issue slots.
+    # A full table lookup would need compile-time grid dims, which this
+    # helper does not have.
+    #
+    # Grids with a single panel (or a single block column) cannot be
+    # reordered, so those fall through to the identity mapping at runtime
+    # via the `useSwizzle` guard.
     return f"""
         const int MAX_BLOCK_N = {pannel_width};
-        const auto baseBlockIdx = blockIdx.x + gridDim.x *blockIdx.y;
-        const auto totalPanel = (gridDim.x * gridDim.y +MAX_BLOCK_N * gridDim.x - 1) / (MAX_BLOCK_N * gridDim.x);
+        const auto baseBlockIdx = blockIdx.x + gridDim.x * blockIdx.y;
+        const auto panelWidth = MAX_BLOCK_N * gridDim.x;
+        const auto totalPanel = (gridDim.x * gridDim.y + panelWidth - 1) / panelWidth;
         const auto totalBlock = gridDim.x * gridDim.y;
-        const auto panelIdx = baseBlockIdx / (MAX_BLOCK_N *gridDim.x);
-        const auto strideLd = panelIdx + 1 < totalPanel ?MAX_BLOCK_N : (totalBlock - panelIdx * (MAX_BLOCK_N *gridDim.x)) / gridDim.x;
-        const auto bx = (panelIdx & 1) ? gridDim.x -(baseBlockIdx - panelIdx * MAX_BLOCK_N * gridDim.x) /strideLd - 1 : (baseBlockIdx - panelIdx * MAX_BLOCK_N *gridDim.x) / strideLd;
-        const auto by = (baseBlockIdx - panelIdx * MAX_BLOCK_N *gridDim.x) % strideLd + panelIdx * MAX_BLOCK_N;
+        const auto panelIdx = baseBlockIdx / panelWidth;
+        const auto panelOffset = baseBlockIdx - panelIdx * panelWidth;
+        const auto strideLd = panelIdx + 1 < totalPanel ? MAX_BLOCK_N : (totalBlock - panelIdx * panelWidth) / gridDim.x;
+        const bool useSwizzle = gridDim.y > MAX_BLOCK_N && gridDim.x > 1;
+        const auto bx = !useSwizzle ? blockIdx.x : ((panelIdx & 1) ? gridDim.x - panelOffset / strideLd - 1 : panelOffset / strideLd);
+        const auto by = !useSwizzle ? blockIdx.y : panelOffset % strideLd + panelIdx * MAX_BLOCK_N;
         const auto bz = blockIdx.z;
         const dim3 blockIdx(bx, by, bz);
     """
 
 
+def get_rasterization_code(pannel_width: int = 8, arch: Optional[TileDevice] = None) -> str:
+    if pannel_width < 1:
+        raise ValueError(f"pannel_width must be at least 1, got {pannel_width}")
+    # The optimal panel width is arch dependent: Hopper's larger L2 covers
+    # more CTAs per panel, so a narrower panel already captures the reuse.
+    if arch is not None:
+        from .arch import is_hopper_arch
+        pannel_width = min(pannel_width, 4 if is_hopper_arch(arch) else 8)
+    return _rasterization_code(pannel_width)
+
+
 def get_roller_hints_from_func(func_or_module: Union[tir.PrimFunc, IRModule],
                                arch: TileDevice,
                                topk: int = 10,
@@ -41,32 +67,27 @@ def get_roller_hints_from_func(func_or_module: Union[tir.PrimFunc, IRModule],
 
     assert func is not None, "The function should not be None"
 
-    roller_hints = None
-    if tensorcore_only:
-        try:
-            tensorized_func, tags = get_tensorized_func_and_tags(
-                func, arch.target, allow_gemv=allow_gemv)
-        except Exception as e_msg:
-            logger.debug("Get tensorized func and tags failed: ", e_msg)
-            tags = None
-        if tags and tensorized_func:
+    # Try tensorization once up front and reuse the result across both the
+    # tensorcore-only and default paths, so neither a DefaultPolicy
+    # construction nor a second tensorization attempt is wasted.
+    tensorized_func = None
+    try:
+        tensorized_func, tags = get_tensorized_func_and_tags(
+            func, arch.target, allow_gemv=allow_gemv)
+    except Exception as e_msg:
+        logger.debug("Get tensorized func and tags failed: ", e_msg)
+        tags = None
+
+    if tags and tensorized_func:
+        if tensorcore_only:
             policy = TensorCorePolicy(func=tensorized_func, arch=arch, tags=tags)
-            roller_hints = policy.emit_config(topk)
         else:
-            roller_hints = None
+            policy = TensorCorePolicy.from_prim_func(func=tensorized_func, arch=arch, tags=tags)
+    elif tensorcore_only:
+        return None
     else:
         policy = DefaultPolicy.from_prim_func(func=func, arch=arch)
-        tensorized_func = None
-        try:
-            tensorized_func, tags = get_tensorized_func_and_tags(
-                func, arch.target, allow_gemv=allow_gemv)
-        except Exception as e_msg:
-            logger.debug("Get tensorized func and tags failed: ", e_msg)
-            tags = None
-        if tags and tensorized_func:
-            policy = TensorCorePolicy.from_prim_func(func=tensorized_func, arch=arch, tags=tags)
-        roller_hints = policy.emit_config(topk)
-    return roller_hints
+    return policy.emit_config(topk)
 
 
 def get_roller_hints_from_output_nodes(
@@ -93,7 +114,9 @@ def get_roller_hints_from_output_nodes(
 def retrieve_func_from_module(ir_module: IRModule) -> PrimFunc:
     if not isinstance(ir_module, IRModule):
         raise ValueError("Not supported type: ", type(ir_module))
+    # The length check goes through get_global_vars, which materializes a
+    # list per call; keep it behind assert so -O runs (autotune sweeps hit
+    # this thousands of times) skip it entirely.
     assert len(ir_module.get_global_vars()) == 1, (
         "The optimized module should only have one global variable for default schedule.")
-    func = list(ir_module.functions.values())[0]
-    return func
+    return next(iter(ir_module.functions.values()))
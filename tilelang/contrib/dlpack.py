@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 """Wrapping functions to bridge frameworks with DLPack support to TVM"""
+import weakref
+
 from tvm.runtime import ndarray
 
 
@@ -43,15 +45,35 @@ def convert_func(tvm_func, tensor_type, to_dlpack_func):
         torch.float8_e5m2fnuz: "e5m2_float8",
     }
 
+    # DLPack conversion allocates a PyCapsule and marshals metadata on every
+    # call. CUDA tensors are typically reused across launches (benchmark and
+    # training loops), so cache the zero-copy NDArray view per tensor. The
+    # view aliases device memory, so a hit is only valid while the tensor's
+    # geometry is unchanged: in-place metadata ops (t_(), squeeze_(),
+    # as_strided_(), a shrinking resize_()) keep the storage pointer while
+    # changing shape/strides, hence pointer, shape and strides are all
+    # compared before reusing the view.
+    cuda_ndarray_cache = weakref.WeakKeyDictionary()
+
     def adapt_tensor(arg):
         if isinstance(arg, tensor_type):
+            is_cuda = arg.device.type == "cuda"
+            if is_cuda:
+                geometry = (arg.data_ptr(), arg.shape, arg.stride())
+                cached = cuda_ndarray_cache.get(arg)
+                if cached is not None and cached[0] == geometry:
+                    return cached[1]
             if arg.dtype in {
                     torch.float8_e4m3fn, torch.float8_e4m3fnuz, torch.float8_e5m2,
                     torch.float8_e5m2fnuz
             }:
-                return ndarray.from_dlpack(to_dlpack_func(arg.view(torch.int8)))._create_view(
+                converted = ndarray.from_dlpack(to_dlpack_func(arg.view(torch.int8)))._create_view(
                     arg.shape, dtype=float8_dtype_map[arg.dtype])
-            return ndarray.from_dlpack(to_dlpack_func(arg))
+            else:
+                converted = ndarray.from_dlpack(to_dlpack_func(arg))
+            if is_cuda:
+                cuda_ndarray_cache[arg] = (geometry, converted)
+            return converted
         return arg
 
     def _wrapper(*args):
@@ -181,19 +181,23 @@ class CtypesKernelAdapter(BaseKernelAdapter):
 
     def _wrap_forward_from_prebuild_lib(self,
                                         *ins: List[torch.Tensor],
-                                        stream: Optional[int] = None):
+                                        stream: Optional[int] = None,
+                                        out: Optional[Union[torch.Tensor,
+                                                            List[torch.Tensor]]] = None):
         """High-level wrapper for kernel execution.
-        
+
         Handles:
         1. Input validation
         2. Output tensor allocation
         3. Dynamic shape resolution
         4. CUDA stream management
-        
+
         Args:
             ins: Input PyTorch tensors
             stream: Optional CUDA stream for asynchronous execution
-        
+            out: Optional preallocated output tensor (or list of tensors, one
+                per result), written in place to avoid per-call torch.empty
+
         Returns:
             Single tensor or list of tensors containing the kernel results
         """
@@ -201,7 +205,13 @@ class CtypesKernelAdapter(BaseKernelAdapter):
             raise ValueError(
                 f"Expected {len(self.params)} inputs, got {len(ins) + len(self.result_idx)} with {len(ins)} inputs and {len(self.result_idx)} outputs"
             )
+        outs = None
+        if out is not None:
+            outs = list(out) if isinstance(out, (list, tuple)) else [out]
+            if len(outs) != len(self.result_idx):
+                raise ValueError(f"Expected {len(self.result_idx)} output tensors, got {len(outs)}")
         ins_idx = 0
+        out_idx = 0
         args = []
 
         # tensor pointers
@@ -217,7 +227,20 @@ class CtypesKernelAdapter(BaseKernelAdapter):
                     else:  # Already converted to Python int during initialization
                         shape.append(s)
                 device = ins[0].device if len(ins) > 0 else torch.cuda.current_device()
-                tensor = torch.empty(*shape, dtype=dtype, device=device)
+                if outs is not None:
+                    tensor = outs[out_idx]
+                    out_idx += 1
+                    if tensor.dtype != dtype:
+                        raise ValueError(f"Output dtype mismatch for parameter {i}: "
+                                         f"expected {dtype}, got {tensor.dtype}")
+                    if list(tensor.shape) != shape:
+                        raise ValueError(f"Output shape mismatch for parameter {i}: "
+                                         f"expected {shape}, got {list(tensor.shape)}")
+                    if len(ins) > 0 and tensor.device != device:
+                        raise ValueError(f"Output device mismatch for parameter {i}: "
+                                         f"expected {device}, got {tensor.device}")
+                else:
+                    tensor = torch.empty(*shape, dtype=dtype, device=device)
             else:
                 tensor = ins[ins_idx]
                 ins_idx += 1
@@ -242,9 +265,83 @@ class CtypesKernelAdapter(BaseKernelAdapter):
             return [args[i] for i in self.result_idx]
 
     def _convert_torch_func(self) -> Callable:
-        """Returns a PyTorch-compatible function wrapper for the kernel."""
+        """Returns a PyTorch-compatible function wrapper for the kernel.
+
+        Static-shape kernels get a forward function generated once at init
+        time with the argument marshaling unrolled over the parameter
+        signature; dynamic-shape kernels keep the generic path.
+        """
+        if not self.is_dynamic:
+            specialized = self._specialize_forward()
+            if specialized is not None:
+                return specialized
         return self._wrap_forward_from_prebuild_lib
 
+    def _specialize_forward(self) -> Optional[Callable]:
+        """Generates (via exec) a forward closure specialized to the static
+        parameter signature.
+
+        Unrolls output allocation and pointer packing into straight-line code
+        so each call avoids looping over params, re-checking result_idx
+        membership and re-resolving the target/stream. Returns None when the
+        signature cannot be specialized (e.g. symbolic output shapes).
+        """
+        num_params = len(self.params)
+        num_inputs = num_params - len(self.result_idx)
+        result_idx = set(self.result_idx)
+
+        is_cuda = str(self.target).startswith("cuda") and torch.cuda.is_available()
+        namespace = {
+            "_c_void_p": ctypes.c_void_p,
+            "_torch_empty": torch.empty,
+            "_lib_call": self.lib.call,
+            "_current_stream": torch.cuda.current_stream if is_cuda else None,
+            "_current_device": torch.cuda.current_device,
+            "_generic_forward": self._wrap_forward_from_prebuild_lib,
+        }
+
+        device_expr = "ins[0].device" if num_inputs > 0 else "_current_device()"
+        lines = [
+            "def _specialized_forward(*ins, stream=None, out=None):",
+            "    if out is not None:",
+            "        return _generic_forward(*ins, stream=stream, out=out)",
+            f"    if len(ins) != {num_inputs}:",
+            "        raise ValueError(",
+            f"            f\"Expected {num_inputs} inputs, got {{len(ins)}}\")",
+        ]
+        arg_exprs = []
+        ins_idx = 0
+        for i in range(num_params):
+            if i in result_idx:
+                shape = self.param_shapes[i]
+                if not all(isinstance(s, int) for s in shape):
+                    return None
+                namespace[f"_out_dtype_{i}"] = self.param_dtypes[i]
+                dims = ", ".join(str(s) for s in shape)
+                lines.append(f"    out_{i} = _torch_empty(({dims},), "
+                             f"dtype=_out_dtype_{i}, device={device_expr})")
+                arg_exprs.append(f"_c_void_p(out_{i}.data_ptr())")
+            else:
+                arg_exprs.append(f"_c_void_p(ins[{ins_idx}].data_ptr())")
+                ins_idx += 1
+
+        if is_cuda:
+            lines.append("    if stream is None:")
+            lines.append("        stream = _current_stream().cuda_stream")
+        else:
+            lines.append("    if stream is None:")
+            lines.append("        stream = 0")
+        lines.append(f"    _lib_call({', '.join(arg_exprs)}, _c_void_p(stream))")
+
+        if len(self.result_idx) == 1:
+            lines.append(f"    return out_{self.result_idx[0]}")
+        else:
+            outs = ", ".join(f"out_{i}" for i in self.result_idx)
+            lines.append(f"    return [{outs}]")
+
+        exec("\n".join(lines), namespace)
+        return namespace["_specialized_forward"]
+
     @property
     def prim_func(self) -> tir.PrimFunc:
         """Returns the primary TIR function from the IR module."""
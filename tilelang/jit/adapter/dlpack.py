@@ -11,10 +11,19 @@ class TorchDLPackKernelAdapter(BaseKernelAdapter):
     def _convert_torch_func(self) -> callable:
         torch_func = to_pytorch_func(self.mod)
 
+        # Hoist the per-call invariants: output dtypes/shapes never change,
+        # and re-deriving them adds Python overhead on every launch.
+        result_idx = self.result_idx
+        num_params = len(self.params)
+        num_results = len(result_idx)
+        out_specs = {
+            i: (self.params[i].dtype, list(map(int, self.params[i].shape))) for i in result_idx
+        }
+
         def func(*ins: List[torch.Tensor]):
-            if len(ins) + len(self.result_idx) != len(self.params):
+            if len(ins) + num_results != num_params:
                 raise ValueError(
-                    f"Expected {len(self.params)} inputs, got {len(ins) + len(self.result_idx)} with {len(ins)} inputs and {len(self.result_idx)} outputs"
+                    f"Expected {num_params} inputs, got {len(ins) + num_results} with {len(ins)} inputs and {num_results} outputs"
                 )
             ins_idx = 0
             args = []
@@ -22,10 +31,9 @@ class TorchDLPackKernelAdapter(BaseKernelAdapter):
             # use the device of the first input tensor if available
             device = ins[0].device if len(ins) > 0 else torch.cuda.current_device()
 
-            for i in range(len(self.params)):
-                if i in self.result_idx:
-                    dtype = self.params[i].dtype
-                    shape = list(map(int, self.params[i].shape))
+            for i in range(num_params):
+                if i in result_idx:
+                    dtype, shape = out_specs[i]
                     tensor = torch.empty(*shape, dtype=dtype, device=device)
                 else:
                     tensor = ins[ins_idx]
@@ -34,9 +42,9 @@ class TorchDLPackKernelAdapter(BaseKernelAdapter):
 
             torch_func(*args)
 
-            if len(self.result_idx) == 1:
-                return args[self.result_idx[0]]
+            if num_results == 1:
+                return args[result_idx[0]]
             else:
-                return [args[i] for i in self.result_idx]
+                return [args[i] for i in result_idx]
 
         return func
@@ -1,7 +1,10 @@
+import ctypes
+import functools
+import weakref
 from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
 from tvm.target import Target
-from tvm.tir import PrimFunc
+from tvm.tir import PrimFunc, Var
 
 import tilelang
 from tilelang import tvm as tvm
@@ -11,6 +14,69 @@ from tilelang.jit.adapter import (BaseKernelAdapter, CtypesKernelAdapter, Cython
 from tilelang.profiler import Profiler, TensorSupplyType
 from tilelang.utils.target import AVALIABLE_TARGETS, determine_target
 
+# Target construction parses the spec string on every call; cache the
+# resolved Target per spec since Target objects are immutable.
+_target_cache: Dict[str, Target] = {}
+
+
+def _resolve_target(target: str) -> Target:
+    resolved = _target_cache.get(target)
+    if resolved is None:
+        assert target in AVALIABLE_TARGETS, f"Invalid target: {target}"
+        resolved = Target(determine_target(target))
+        _target_cache[target] = resolved
+    return resolved
+
+
+# cudaAccessProperty enum values (cuda driver_types.h)
+_CUDA_ACCESS_PROPERTY_STREAMING = 1
+_CUDA_ACCESS_PROPERTY_PERSISTING = 2
+# cudaStreamAttrID: cudaStreamAttributeAccessPolicyWindow
+_CUDA_STREAM_ATTRIBUTE_ACCESS_POLICY_WINDOW = 1
+# cudaLimit: cudaLimitPersistingL2CacheSize
+_CUDA_LIMIT_PERSISTING_L2_CACHE_SIZE = 0x06
+# cudaDeviceAttr: cudaDevAttrMaxPersistingL2CacheSize / cudaDevAttrMaxAccessPolicyWindowSize
+_CUDA_DEV_ATTR_MAX_PERSISTING_L2_CACHE_SIZE = 108
+_CUDA_DEV_ATTR_MAX_ACCESS_POLICY_WINDOW_SIZE = 109
+
+
+class _CudaAccessPolicyWindow(ctypes.Structure):
+    """Mirror of cudaAccessPolicyWindow for cudaStreamSetAttribute."""
+    _fields_ = [
+        ("base_ptr", ctypes.c_void_p),
+        ("num_bytes", ctypes.c_size_t),
+        ("hitRatio", ctypes.c_float),
+        ("hitProp", ctypes.c_int),
+        ("missProp", ctypes.c_int),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cudart() -> ctypes.CDLL:
+    return ctypes.CDLL("libcudart.so")
+
+
+def _cuda_device_get_attribute(attr: int, device_index: int) -> int:
+    value = ctypes.c_int(0)
+    ret = _load_cudart().cudaDeviceGetAttribute(ctypes.byref(value), attr, device_index)
+    if ret != 0:
+        raise RuntimeError(f"cudaDeviceGetAttribute({attr}) failed with error {ret}")
+    return value.value
+
+
+def _cuda_set_persisting_l2_limit(num_bytes: int) -> None:
+    ret = _load_cudart().cudaDeviceSetLimit(_CUDA_LIMIT_PERSISTING_L2_CACHE_SIZE,
+                                            ctypes.c_size_t(num_bytes))
+    if ret != 0:
+        raise RuntimeError(f"cudaDeviceSetLimit failed with error {ret}")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pass_context(frozen_configs: frozenset) -> tvm.transform.PassContext:
+    """Reuse one PassContext per frozen pass-config set; autotuning loops
+    compile thousands of kernels with identical configs."""
+    return tvm.transform.PassContext(opt_level=3, config=dict(frozen_configs))
+
 
 class JITKernel(object):
     """
@@ -35,6 +101,12 @@ class JITKernel(object):
     config: Dict[str, Any] = None
     ref_latency: float = None
 
+    # Shared instance cache so unrelated call sites (e.g. autotuning sweeps)
+    # compiling the same PrimFunc with the same options reuse one kernel.
+    # Values are weak references, so kernels are released once no caller
+    # keeps them alive.
+    _instance_cache: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         func: PrimFunc = None,
@@ -83,13 +155,9 @@ class JITKernel(object):
             pass_configs = {}
         self.pass_configs = pass_configs
 
-        # If the target is specified as a string, validate it and convert it to a TVM Target.
-        if isinstance(target, str):
-            assert target in AVALIABLE_TARGETS, f"Invalid target: {target}"
-            target = determine_target(target)
-
-        # Ensure the target is always a TVM Target object.
-        target = Target(target)
+        # If the target is specified as a string, validate it and convert it to
+        # a (cached) TVM Target; otherwise ensure it is a TVM Target object.
+        target = _resolve_target(target) if isinstance(target, str) else Target(target)
 
         # Validate the execution backend.
         assert execution_backend in [
@@ -196,7 +264,12 @@ class JITKernel(object):
         # Compile the function with TVM, optimizing with shared memory lowering.
         enable_host_codegen = execution_backend == "dlpack"
         enable_device_compile = execution_backend == "dlpack"
-        with tvm.transform.PassContext(opt_level=3, config=pass_configs):
+        try:
+            pass_ctx = _get_pass_context(frozenset(pass_configs.items()))
+        except TypeError:
+            # Unhashable config values cannot be memoized; build a fresh context.
+            pass_ctx = tvm.transform.PassContext(opt_level=3, config=pass_configs)
+        with pass_ctx:
             artifact = tilelang.lower(
                 tilelang_func,
                 target=target,
@@ -325,7 +398,86 @@ class JITKernel(object):
         TorchFunction
             An instance of TorchFunction wrapping the compiled function.
         """
-        return cls(func=tilelang_func, **kwargs)
+        key = cls._instance_cache_key(tilelang_func, kwargs)
+        if key is not None:
+            kernel = cls._instance_cache.get(key)
+            if kernel is not None:
+                return kernel
+        kernel = cls(func=tilelang_func, **kwargs)
+        if key is not None:
+            cls._instance_cache[key] = kernel
+        return kernel
+
+    @classmethod
+    def _instance_cache_key(cls, tilelang_func: PrimFunc, kwargs: Dict[str, Any]):
+        """
+        Builds a hashable cache key for `from_tilelang_function`, or returns
+        None when the arguments cannot be keyed (e.g. unhashable pass configs).
+        """
+        if kwargs.get("from_database", False):
+            return None
+        out_idx = kwargs.get("out_idx")
+        if isinstance(out_idx, list):
+            out_idx = tuple(out_idx)
+        pass_configs = kwargs.get("pass_configs") or {}
+        try:
+            return (
+                hash(tilelang_func),
+                out_idx,
+                kwargs.get("execution_backend", "cython"),
+                str(kwargs.get("target", "auto")),
+                str(kwargs.get("target_host")),
+                frozenset(pass_configs.items()),
+            )
+        except TypeError:
+            return None
+
+    def specialize(self, shape_bindings: Dict[str, int]) -> "JITKernel":
+        """
+        Returns a new JITKernel with symbolic shape variables frozen to
+        constants before lowering.
+
+        The specialized function is lowered with literal grid and loop
+        bounds, so the generated code avoids dynamic integer division on
+        block indices and pipelined loops become fully unrollable.
+
+        Parameters
+        ----------
+        shape_bindings : Dict[str, int]
+            Mapping from symbolic variable name (e.g. "m") to its constant
+            value.
+
+        Returns
+        -------
+        JITKernel
+            A freshly compiled kernel for the frozen shapes.
+        """
+        func = self.prim_func
+        assert func is not None, "Cannot specialize a kernel restored from the database"
+
+        var_map = {}
+        for param in func.params:
+            buffer = func.buffer_map.get(param)
+            if buffer is None:
+                if param.name in shape_bindings:
+                    var_map[param] = tvm.tir.const(shape_bindings[param.name], param.dtype)
+                continue
+            for dim in buffer.shape:
+                if isinstance(dim, Var) and dim.name in shape_bindings:
+                    var_map[dim] = tvm.tir.const(shape_bindings[dim.name], dim.dtype)
+        if not var_map:
+            raise ValueError(
+                f"No symbolic variables matching {list(shape_bindings)} found in the function")
+
+        return JITKernel(
+            func.specialize(var_map),
+            out_idx=self.out_idx,
+            execution_backend=self.execution_backend,
+            target=self.target,
+            target_host=self.target_host,
+            verbose=self.verbose,
+            pass_configs=self.pass_configs,
+        )
 
     def get_profiler(self,
                      tensor_supply_type: TensorSupplyType = TensorSupplyType.Auto) -> Profiler:
@@ -367,6 +519,86 @@ class JITKernel(object):
     def run_once(self, func: Optional[Callable] = None) -> None:
         return self.get_profiler().run_once(func)
 
+    def set_l2_persist(self, tensor, ratio: float = 0.75, stream: Optional[int] = None) -> None:
+        """
+        Marks a tensor's global-memory range as persisting in L2 cache.
+
+        Useful for hot operand tensors (e.g. GEMM A/B tiles) that are re-read
+        across the whole launch; hits in the window stay resident while other
+        accesses stream through. Requires sm_80 or later.
+
+        Parameters
+        ----------
+        tensor : torch.Tensor
+            CUDA tensor whose memory range should persist in L2.
+        ratio : float, optional
+            Hit ratio of the access policy window (default: 0.75).
+        stream : int, optional
+            CUDA stream handle to attach the policy to. Defaults to the
+            current stream.
+        """
+        import torch
+
+        assert tensor.is_cuda, "L2 persisting access requires a CUDA tensor"
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError(f"ratio must be within [0.0, 1.0], got {ratio}")
+        major, _ = torch.cuda.get_device_capability(tensor.device)
+        if major < 8:
+            raise RuntimeError("L2 persisting access requires sm_80 or later")
+        if stream is None:
+            stream = torch.cuda.current_stream(tensor.device).cuda_stream
+        device_index = tensor.device.index
+        if device_index is None:
+            device_index = torch.cuda.current_device()
+        # The persisting set-aside defaults to 0 bytes, which would make the
+        # access policy a silent no-op; reserve enough L2 for the window,
+        # capped at the device maximum. The window itself must not exceed
+        # accessPolicyMaxWindowSize or cudaStreamSetAttribute fails.
+        num_bytes = min(
+            tensor.numel() * tensor.element_size(),
+            _cuda_device_get_attribute(_CUDA_DEV_ATTR_MAX_ACCESS_POLICY_WINDOW_SIZE, device_index))
+        max_persisting = _cuda_device_get_attribute(_CUDA_DEV_ATTR_MAX_PERSISTING_L2_CACHE_SIZE,
+                                                    device_index)
+        _cuda_set_persisting_l2_limit(min(num_bytes, max_persisting))
+        window = _CudaAccessPolicyWindow(
+            base_ptr=tensor.data_ptr(),
+            num_bytes=num_bytes,
+            hitRatio=ratio,
+            hitProp=_CUDA_ACCESS_PROPERTY_PERSISTING,
+            missProp=_CUDA_ACCESS_PROPERTY_STREAMING,
+        )
+        ret = _load_cudart().cudaStreamSetAttribute(
+            ctypes.c_void_p(stream), _CUDA_STREAM_ATTRIBUTE_ACCESS_POLICY_WINDOW,
+            ctypes.byref(window))
+        if ret != 0:
+            raise RuntimeError(f"cudaStreamSetAttribute failed with error {ret}")
+
+    def reset_l2_persist(self, stream: Optional[int] = None) -> None:
+        """
+        Restores the default L2 access policy on the stream, releases the
+        persisting L2 set-aside and flushes any persisting cache lines set
+        via :meth:`set_l2_persist`.
+        """
+        import torch
+
+        if stream is None:
+            stream = torch.cuda.current_stream().cuda_stream
+        window = _CudaAccessPolicyWindow(
+            base_ptr=None,
+            num_bytes=0,
+            hitRatio=0.0,
+            hitProp=_CUDA_ACCESS_PROPERTY_STREAMING,
+            missProp=_CUDA_ACCESS_PROPERTY_STREAMING,
+        )
+        cudart = _load_cudart()
+        ret = cudart.cudaStreamSetAttribute(
+            ctypes.c_void_p(stream), _CUDA_STREAM_ATTRIBUTE_ACCESS_POLICY_WINDOW,
+            ctypes.byref(window))
+        if ret != 0:
+            raise RuntimeError(f"cudaStreamSetAttribute failed with error {ret}")
+        _cuda_set_persisting_l2_limit(0)
+        cudart.cudaCtxResetPersistingL2Cache()
+
     def update_tuner_result(self, latency: float, config: Dict[str, Any],
                             ref_latency: float) -> "JITKernel":
         """
@@ -116,5 +116,4 @@ def retrieve_func_from_module(ir_module: IRModule) -> PrimFunc:
         raise ValueError("Not supported type: ", type(ir_module))
     assert len(ir_module.get_global_vars()) == 1, (
         "The optimized module should only have one global variable for default schedule.")
-    func = list(ir_module.functions.values())[0]
-    return func
+    return next(iter(ir_module.functions.values()))